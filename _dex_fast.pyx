@@ -0,0 +1,74 @@
+# cython: language_level=3
+# apk_decompiler.py içindeki sık çağrılan yardımcı fonksiyonların Cython sürümleri.
+# Derlemek için: python setup.py build_ext --inplace
+# Modül derlenmemişse apk_decompiler.py saf Python sürümlerini kullanır.
+
+cimport cython
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t _read_uleb128(const unsigned char[::1] data, Py_ssize_t offset,
+                                     unsigned long long *result) noexcept nogil:
+    """ULEB128 değerini okur; veri sonu aşılırsa -1 döndürür."""
+    cdef Py_ssize_t size = data.shape[0]
+    cdef unsigned long long value = 0
+    cdef unsigned int shift = 0
+    cdef unsigned char byte
+    while True:
+        if offset < 0 or offset >= size:
+            return -1
+        byte = data[offset]
+        if shift < 64:
+            value |= <unsigned long long>(byte & 0x7f) << shift
+        offset += 1
+        if not (byte & 0x80):
+            break
+        shift += 7
+    result[0] = value
+    return offset
+
+
+def read_uleb128(const unsigned char[::1] data, Py_ssize_t offset):
+    """ULEB128 formatında değişken uzunluklu tamsayıyı okur."""
+    cdef unsigned long long result
+    cdef Py_ssize_t end = _read_uleb128(data, offset, &result)
+    if end < 0:
+        raise IndexError("ULEB128 değeri veri sınırını aşıyor")
+    return result, end
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline str _decode_string(const unsigned char[::1] data, Py_ssize_t offset, Py_ssize_t *end):
+    """Uzunluk önekli string'i çözer ve string'in bitiş ofsetini end içine yazar."""
+    cdef unsigned long long length
+    cdef Py_ssize_t start = _read_uleb128(data, offset, &length)
+    cdef Py_ssize_t count
+    if start < 0:
+        raise IndexError("ULEB128 değeri veri sınırını aşıyor")
+    end[0] = start + <Py_ssize_t>length
+    # Saf Python sürümündeki dilimleme gibi, veri sonunu aşan uzunluğu kırpıyoruz.
+    count = <Py_ssize_t>min(length, <unsigned long long>(data.shape[0] - start))
+    if count == 0:
+        return ''
+    return PyUnicode_DecodeUTF8(<char *>&data[start], count, "replace")
+
+
+def read_string(const unsigned char[::1] data, Py_ssize_t offset):
+    """DEX string verisini UTF-8 olarak çözer."""
+    cdef Py_ssize_t end
+    text = _decode_string(data, offset, &end)
+    return text, end
+
+
+def parse_string_pool(const unsigned char[::1] data, offsets):
+    """Verilen ofsetlerdeki tüm string'leri tek geçişte çözer."""
+    cdef list strings = [None] * len(offsets)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t end
+    for offset in offsets:
+        strings[i] = _decode_string(data, offset, &end)
+        i += 1
+    return strings
@@ -8,19 +8,42 @@ import struct   # Dosyadaki sayıları ve verileri doğru şekilde okumamıza ya
 import os       # Dosyaları açmak ve kaydetmek gibi işlemler için kullanılır.
 import sys      # Programı kapatmak veya hata mesajları göstermek için lazım.
 import logging  # Program çalışırken neler olduğunu kullanıcıya haber verir.
+import mmap     # DEX dosyalarını belleğe kopyalamadan okumak için kullanılır.
+import array    # Sayı tablolarını Python nesnesi oluşturmadan, sıkışık biçimde saklar.
 from typing import List, Dict, Tuple  # Gerekli türleri açıkça belirtiyoruz.
-from concurrent.futures import ThreadPoolExecutor  # Birden fazla işi aynı anda yapmamızı sağlar.
+from concurrent.futures import ProcessPoolExecutor  # Birden fazla DEX dosyasını aynı anda işlememizi sağlar.
 from colorama import init, Fore, Style  # Çıktıları renkli yapar.
 import subprocess  # apktool komutlarını çalıştırmak için kullanılır.
 import glob  # DEX dosyalarını bulmak için kullanılır.
 
-# Renkli terminal çıktıları için colorama başlatma
-init()
+# Renkli çıktı yalnızca terminale yazarken kullanılır; çıktı dosyaya veya boruya yönlendirildiğinde
+# ANSI kodları eklenmez ve colorama akışı sarmalamaz.
+_USE_COLOR = sys.stderr.isatty()
+if _USE_COLOR:
+    init()
 
 # Logging ayarları
-logging.basicConfig(level=logging.INFO, format=f"{Fore.BLUE}%(levelname)s{Style.RESET_ALL}: %(message)s")
+_LEVEL_FORMAT = f"{Fore.BLUE}%(levelname)s{Style.RESET_ALL}" if _USE_COLOR else "%(levelname)s"
+logging.basicConfig(level=logging.INFO, format=f"{_LEVEL_FORMAT}: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Önceden derlenmiş struct biçimleri (her çağrıda biçim dizesi yeniden ayrıştırılmaz)
+_FIELD = struct.Struct('<HHI')
+_METHOD = struct.Struct('<HHI')
+_CLASS = struct.Struct('<IIIIIIII')
+_CODE_HDR = struct.Struct('<HHHHII')
+# Başlıktaki 56..104 aralığı: string, type, proto, field, method ve class_def tabloları
+_HEADER_OFFSET = 56
+_HEADER = struct.Struct('<12I')
+_HEADER_KEYS = (
+    'string_ids_size', 'string_ids_off',
+    'type_ids_size', 'type_ids_off',
+    'proto_ids_size', 'proto_ids_off',
+    'field_ids_size', 'field_ids_off',
+    'method_ids_size', 'method_ids_off',
+    'class_defs_size', 'class_defs_off',
+)
+
 # Özel hata sınıfı
 class DexParseError(Exception):
     """DEX ayrıştırma hataları için özel istisna sınıfı."""
@@ -29,8 +52,13 @@ class DexParseError(Exception):
 ### Yardımcı Fonksiyonlar ###
 def read_uleb128(data: bytes, offset: int) -> Tuple[int, int]:
     """ULEB128 formatında değişken uzunluklu tamsayıyı okur."""
-    result = 0
-    shift = 0
+    byte = data[offset]
+    # DEX'teki değerlerin çoğu (ör. string uzunlukları) tek bayta sığar; döngüye girmeden dönüyoruz.
+    if byte < 0x80:
+        return byte, offset + 1
+    result = byte & 0x7f
+    shift = 7
+    offset += 1
     while True:
         byte = data[offset]
         result |= (byte & 0x7f) << shift
@@ -46,273 +74,301 @@ def read_string(data: bytes, offset: int) -> Tuple[str, int]:
     string_data = data[offset:offset + length].decode('utf-8', errors='replace')
     return string_data, offset + length
 
+def read_u32_array(data: bytes, offset: int, count: int) -> array.array:
+    """Little-endian u32 tablosunu tek C çağrısıyla sıkışık bir array.array olarak okur."""
+    table = array.array('I')
+    end = offset + count * table.itemsize
+    if end > len(data):
+        raise DexParseError("Tablo dosya sınırını aşıyor")
+    table.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        table.byteswap()
+    return table
+
+def read_table_columns(record: struct.Struct, n_cols: int, data: bytes, offset: int, count: int) -> List[Tuple[int, ...]]:
+    """Sabit boyutlu kayıtlardan oluşan tabloyu tek çağrıda okur ve her kayıt alanını ayrı bir sütuna ayırır."""
+    end = offset + count * record.size
+    if end > len(data):
+        raise DexParseError("Tablo dosya sınırını aşıyor")
+    if count == 0:
+        return [()] * n_cols
+    return list(zip(*record.iter_unpack(memoryview(data)[offset:end])))
+
+def parse_string_pool(data: bytes, offsets: List[int]) -> List[str]:
+    """Verilen ofsetlerdeki tüm string'leri sırayla çözer."""
+    return [read_string(data, offset)[0] for offset in offsets]
+
+# Derlenmiş Cython sürümleri (bkz. _dex_fast.pyx) varsa saf Python sürümlerinin yerine kullanılır.
+try:
+    from _dex_fast import read_uleb128, read_string, parse_string_pool
+except ImportError:
+    pass
+
 ### DEX Ayrıştırma Fonksiyonları ###
 def parse_header(data: bytes) -> Dict[str, int]:
     """DEX dosyasının başlığını ayrıştırır."""
     magic = data[:8]
     if magic[:4] != b'dex\n':
         raise DexParseError("Geçersiz DEX dosya formatı")
-    return {
-        'string_ids_size': struct.unpack('<I', data[56:60])[0],
-        'string_ids_off': struct.unpack('<I', data[60:64])[0],
-        'type_ids_size': struct.unpack('<I', data[64:68])[0],
-        'type_ids_off': struct.unpack('<I', data[68:72])[0],
-        'field_ids_size': struct.unpack('<I', data[80:84])[0],
-        'field_ids_off': struct.unpack('<I', data[84:88])[0],
-        'method_ids_size': struct.unpack('<I', data[88:92])[0],
-        'method_ids_off': struct.unpack('<I', data[92:96])[0],
-        'class_defs_size': struct.unpack('<I', data[96:100])[0],
-        'class_defs_off': struct.unpack('<I', data[100:104])[0],
-    }
+    if len(data) < _HEADER_OFFSET + _HEADER.size:
+        raise DexParseError("DEX başlığı eksik")
+    return dict(zip(_HEADER_KEYS, _HEADER.unpack_from(data, _HEADER_OFFSET)))
 
 def parse_strings(data: bytes, header: Dict[str, int]) -> List[str]:
-    """String tablosunu paralel olarak ayrıştırır."""
+    """String tablosunu ayrıştırır."""
     string_ids_off = header['string_ids_off']
     string_ids_size = header['string_ids_size']
-    string_offsets = [struct.unpack('<I', data[string_ids_off + i * 4:string_ids_off + i * 4 + 4])[0] 
-                      for i in range(string_ids_size)]
-    strings = [None] * string_ids_size
-
-    def process_string(idx: int):
-        string_data, _ = read_string(data, string_offsets[idx])
-        strings[idx] = string_data
-
-    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
-        executor.map(process_string, range(string_ids_size))
-    
-    return strings
+    string_offsets = read_u32_array(data, string_ids_off, string_ids_size)
+    # İş tamamen GIL altında yürüdüğü için thread havuzu hız kazandırmaz; düz döngü daha hızlıdır.
+    return parse_string_pool(data, string_offsets)
 
 def parse_types(data: bytes, header: Dict[str, int], strings: List[str]) -> List[str]:
     """Tip tablosunu ayrıştırır."""
     type_ids_off = header['type_ids_off']
     type_ids_size = header['type_ids_size']
-    return [strings[struct.unpack('<I', data[type_ids_off + i * 4:type_ids_off + i * 4 + 4])[0]] 
-            for i in range(type_ids_size)]
-
-def parse_fields(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> List[Dict[str, str]]:
-    """Alan (field) tablosunu ayrıştırır."""
-    field_ids_off = header['field_ids_off']
-    field_ids_size = header['field_ids_size']
-    fields = []
-    for i in range(field_ids_size):
-        offset = field_ids_off + i * 8
-        class_idx, type_idx, name_idx = struct.unpack('<HHI', data[offset:offset + 8])
-        fields.append({
-            'class': types[class_idx],
-            'type': types[type_idx],
-            'name': strings[name_idx]
-        })
-    return fields
-
-def parse_methods(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> List[Dict[str, str]]:
-    """Yöntem (method) tablosunu ayrıştırır."""
-    method_ids_off = header['method_ids_off']
-    method_ids_size = header['method_ids_size']
-    methods = []
-    for i in range(method_ids_size):
-        offset = method_ids_off + i * 8
-        class_idx, proto_idx, name_idx = struct.unpack('<HHI', data[offset:offset + 8])
-        methods.append({
-            'class': types[class_idx],
-            'name': strings[name_idx],
-            'proto_idx': proto_idx
-        })
-    return methods
-
-def parse_classes(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> List[Dict[str, str]]:
-    """Sınıf tanımlarını ayrıştırır."""
-    class_defs_off = header['class_defs_off']
-    class_defs_size = header['class_defs_size']
-    classes = []
-    for i in range(class_defs_size):
-        start = class_defs_off + i * 32
-        class_idx, _, superclass_idx, _, source_file_idx, _, class_data_off, _ = \
-            struct.unpack('<IIIIIIII', data[start:start + 32])
-        classes.append({
-            'name': types[class_idx],
-            'superclass': types[superclass_idx] if superclass_idx != 0xFFFFFFFF else None,
-            'data_offset': class_data_off,
-            'source_file': strings[source_file_idx] if source_file_idx != 0xFFFFFFFF else None
-        })
-    return classes
+    type_idxs = read_u32_array(data, type_ids_off, type_ids_size)
+    return [strings[i] for i in type_idxs]
+
+def parse_fields(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> Dict[str, List[str]]:
+    """Alan (field) tablosunu sütunlar halinde ayrıştırır."""
+    class_idxs, type_idxs, name_idxs = read_table_columns(
+        _FIELD, 3, data, header['field_ids_off'], header['field_ids_size'])
+    return {
+        'class': [types[i] for i in class_idxs],
+        'type': [types[i] for i in type_idxs],
+        'name': [strings[i] for i in name_idxs],
+    }
+
+def parse_methods(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> Dict[str, list]:
+    """Yöntem (method) tablosunu sütunlar halinde ayrıştırır."""
+    class_idxs, proto_idxs, name_idxs = read_table_columns(
+        _METHOD, 3, data, header['method_ids_off'], header['method_ids_size'])
+    return {
+        'class': [types[i] for i in class_idxs],
+        'name': [strings[i] for i in name_idxs],
+        'proto_idx': proto_idxs,
+    }
+
+def parse_classes(data: bytes, header: Dict[str, int], strings: List[str], types: List[str]) -> Dict[str, list]:
+    """Sınıf tanımlarını sütunlar halinde ayrıştırır."""
+    class_idxs, _, superclass_idxs, _, source_file_idxs, _, class_data_offs, _ = read_table_columns(
+        _CLASS, 8, data, header['class_defs_off'], header['class_defs_size'])
+    return {
+        'name': [types[i] for i in class_idxs],
+        'superclass': [types[i] if i != 0xFFFFFFFF else None for i in superclass_idxs],
+        'data_offset': class_data_offs,
+        'source_file': [strings[i] if i != 0xFFFFFFFF else None for i in source_file_idxs],
+    }
 
 ### Decompile İşlemi ###
 def function(args, types):
     return f'v{args[0]} = ({types[args[1]]}) v{args[0]};'
 
+# Handler'a verilecek bağlam tablosu. Her OPCODE_MAP girdisi (isim, handler, bağlam) biçimindedir; üçüncü alan
+# handler'ın hangi tabloya ihtiyaç duyduğunu belirtir, şablonlar tablo almadığı için _CTX_NONE kullanır.
+_CTX_NONE, _CTX_STRINGS, _CTX_TYPES, _CTX_FIELD_NAMES, _CTX_METHOD_NAMES, _CTX_METHOD_SIGS = range(6)
+
 OPCODE_MAP = {
-    0x00: ('nop', lambda args, _: ''),
-    0x0e: ('return-void', lambda args, _: 'return;'),
-    0x0f: ('return', lambda args, _: f'return v{args[0]};'),
-    0x10: ('return-wide', lambda args, _: f'return v{args[0]};  // wide'),
-    0x11: ('return-object', lambda args, _: f'return v{args[0]};  // object'),
-    0x01: ('move', lambda args, _: f'v{args[0]} = v{args[1]};'),
-    0x02: ('move/from16', lambda args, _: f'v{args[0]} = v{args[1]};'),
-    0x03: ('move/16', lambda args, _: f'v{args[0]} = v{args[1]};'),
-    0x04: ('move-wide', lambda args, _: f'v{args[0]} = v{args[1]};  // wide'),
-    0x05: ('move-wide/from16', lambda args, _: f'v{args[0]} = v{args[1]};  // wide'),
-    0x06: ('move-wide/16', lambda args, _: f'v{args[0]} = v{args[1]};  // wide'),
-    0x07: ('move-object', lambda args, _: f'v{args[0]} = v{args[1]};  // object'),
-    0x08: ('move-object/from16', lambda args, _: f'v{args[0]} = v{args[1]};  // object'),
-    0x09: ('move-object/16', lambda args, _: f'v{args[0]} = v{args[1]};  // object'),
-    0x0a: ('move-result', lambda args, _: f'v{args[0]} = result;'),
-    0x0b: ('move-result-wide', lambda args, _: f'v{args[0]} = result;  // wide'),
-    0x0c: ('move-result-object', lambda args, _: f'v{args[0]} = result;  // object'),
-    0x0d: ('move-exception', lambda args, _: f'v{args[0]} = exception;'),
-    0x12: ('const/4', lambda args, _: f'v{args[0]} = {args[1] & 0xF};'),
-    0x13: ('const/16', lambda args, val: f'v{args[0]} = {val};'),
-    0x14: ('const', lambda args, val: f'v{args[0]} = {val};'),
-    0x15: ('const/high16', lambda args, val: f'v{args[0]} = {val << 16};'),
-    0x16: ('const-wide/16', lambda args, val: f'v{args[0]} = {val};  // wide'),
-    0x17: ('const-wide/32', lambda args, val: f'v{args[0]} = {val};  // wide'),
-    0x18: ('const-wide', lambda args, val: f'v{args[0]} = {val};  // wide'),
-    0x19: ('const-wide/high16', lambda args, val: f'v{args[0]} = {val << 48};  // wide'),
-    0x1a: ('const-string', lambda args, strings: f'v{args[0]} = "{strings[args[1]]}";'),
-    0x1b: ('const-string/jumbo', lambda args, strings: f'v{args[0]} = "{strings[args[1]]}";'),
-    0x1c: ('const-class', lambda args, types: f'v{args[0]} = {types[args[1]]}.class;'),
-    0x52: ('iget', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};'),
-    0x53: ('iget-wide', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // wide'),
-    0x54: ('iget-object', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // object'),
-    0x55: ('iget-boolean', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // boolean'),
-    0x56: ('iget-byte', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // byte'),
-    0x57: ('iget-char', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // char'),
-    0x58: ('iget-short', lambda args, fields: f'v{args[0]} = {fields[args[2]]["name"]};  // short'),
-    0x59: ('iput', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};'),
-    0x5a: ('iput-wide', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // wide'),
-    0x5b: ('iput-object', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // object'),
-    0x5c: ('iput-boolean', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // boolean'),
-    0x5d: ('iput-byte', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // byte'),
-    0x5e: ('iput-char', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // char'),
-    0x5f: ('iput-short', lambda args, fields: f'{fields[args[2]]["name"]} = v{args[0]};  // short'),
-    0x60: ('sget', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static'),
-    0x61: ('sget-wide', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static wide'),
-    0x62: ('sget-object', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static object'),
-    0x63: ('sget-boolean', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static boolean'),
-    0x64: ('sget-byte', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static byte'),
-    0x65: ('sget-char', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static char'),
-    0x66: ('sget-short', lambda args, fields: f'v{args[0]} = {fields[args[1]]["name"]};  // static short'),
-    0x67: ('sput', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static'),
-    0x68: ('sput-wide', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static wide'),
-    0x69: ('sput-object', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static object'),
-    0x6a: ('sput-boolean', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static boolean'),
-    0x6b: ('sput-byte', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static byte'),
-    0x6c: ('sput-char', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static char'),
-    0x6d: ('sput-short', lambda args, fields: f'{fields[args[1]]["name"]} = v{args[0]};  // static short'),
-    0x6e: ('invoke-virtual', lambda args, methods: f'v{args[1]}.{methods[args[0]]["name"]}(...);'),
-    0x6f: ('invoke-super', lambda args, methods: f'super.{methods[args[0]]["name"]}(...);'),
-    0x70: ('invoke-direct', lambda args, methods: f'{methods[args[0]]["name"]}(...);'),
-    0x71: ('invoke-static', lambda args, methods: f'{methods[args[0]]["class"]}.{methods[args[0]]["name"]}(...);'),
-    0x72: ('invoke-interface', lambda args, methods: f'v{args[1]}.{methods[args[0]]["name"]}(...);  // interface'),
-    0x74: ('invoke-virtual/range', lambda args, methods: f'v{args[1]}.{methods[args[0]]["name"]}(...);  // range'),
-    0x75: ('invoke-super/range', lambda args, methods: f'super.{methods[args[0]]["name"]}(...);  // range'),
-    0x76: ('invoke-direct/range', lambda args, methods: f'{methods[args[0]]["name"]}(...);  // range'),
-    0x77: ('invoke-static/range', lambda args, methods: f'{methods[args[0]]["class"]}.{methods[args[0]]["name"]}(...);  // range'),
-    0x78: ('invoke-interface/range', lambda args, methods: f'v{args[1]}.{methods[args[0]]["name"]}(...);  // interface, range'),
-    0x90: ('add-int', lambda args, _: f'v{args[0]} = v{args[1]} + v{args[2]};'),
-    0x91: ('sub-int', lambda args, _: f'v{args[0]} = v{args[1]} - v{args[2]};'),
-    0x92: ('mul-int', lambda args, _: f'v{args[0]} = v{args[1]} * v{args[2]};'),
-    0x93: ('div-int', lambda args, _: f'v{args[0]} = v{args[1]} / v{args[2]};'),
-    0x94: ('rem-int', lambda args, _: f'v{args[0]} = v{args[1]} % v{args[2]};'),
-    0x95: ('and-int', lambda args, _: f'v{args[0]} = v{args[1]} & v{args[2]};'),
-    0x96: ('or-int', lambda args, _: f'v{args[0]} = v{args[1]} | v{args[2]};'),
-    0x97: ('xor-int', lambda args, _: f'v{args[0]} = v{args[1]} ^ v{args[2]};'),
-    0x98: ('shl-int', lambda args, _: f'v{args[0]} = v{args[1]} << v{args[2]};'),
-    0x99: ('shr-int', lambda args, _: f'v{args[0]} = v{args[1]} >> v{args[2]};'),
-    0x9a: ('ushr-int', lambda args, _: f'v{args[0]} = v{args[1]} >>> v{args[2]};'),
-    0xb0: ('add-int/2addr', lambda args, _: f'v{args[0]} += v{args[1]};'),
-    0xb1: ('sub-int/2addr', lambda args, _: f'v{args[0]} -= v{args[1]};'),
-    0xb2: ('mul-int/2addr', lambda args, _: f'v{args[0]} *= v{args[1]};'),
-    0xb3: ('div-int/2addr', lambda args, _: f'v{args[0]} /= v{args[1]};'),
-    0xb4: ('rem-int/2addr', lambda args, _: f'v{args[0]} %= v{args[1]};'),
-    0xb5: ('and-int/2addr', lambda args, _: f'v{args[0]} &= v{args[1]};'),
-    0xb6: ('or-int/2addr', lambda args, _: f'v{args[0]} |= v{args[1]};'),
-    0xb7: ('xor-int/2addr', lambda args, _: f'v{args[0]} ^= v{args[1]};'),
-    0xb8: ('shl-int/2addr', lambda args, _: f'v{args[0]} <<= v{args[1]};'),
-    0xb9: ('shr-int/2addr', lambda args, _: f'v{args[0]} >>= v{args[1]};'),
-    0xba: ('ushr-int/2addr', lambda args, _: f'v{args[0]} >>>= v{args[1]};'),
-    0xd0: ('add-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} + {val};'),
-    0xd1: ('sub-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} - {val};'),
-    0xd2: ('mul-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} * {val};'),
-    0xd3: ('div-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} / {val};'),
-    0xd4: ('rem-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} % {val};'),
-    0xd5: ('and-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} & {val};'),
-    0xd6: ('or-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} | {val};'),
-    0xd7: ('xor-int/lit16', lambda args, val: f'v{args[0]} = v{args[1]} ^ {val};'),
-    0xd8: ('add-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} + {val};'),
-    0xd9: ('sub-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} - {val};'),
-    0xda: ('mul-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} * {val};'),
-    0xdb: ('div-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} / {val};'),
-    0xdc: ('rem-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} % {val};'),
-    0xdd: ('and-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} & {val};'),
-    0xde: ('or-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} | {val};'),
-    0xdf: ('xor-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} ^ {val};'),
-    0xe0: ('shl-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} << {val};'),
-    0xe1: ('shr-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} >> {val};'),
-    0xe2: ('ushr-int/lit8', lambda args, val: f'v{args[0]} = v{args[1]} >>> {val};'),
-    0x2d: ('cmpl-float', lambda args, _: f'v{args[0]} = (v{args[1]} < v{args[2]}) ? -1 : ((v{args[1]} == v{args[2]}) ? 0 : 1);'),
-    0x2e: ('cmpg-float', lambda args, _: f'v{args[0]} = (v{args[1]} > v{args[2]}) ? 1 : ((v{args[1]} == v{args[2]}) ? 0 : -1);'),
-    0x2f: ('cmpl-double', lambda args, _: f'v{args[0]} = (v{args[1]} < v{args[2]}) ? -1 : ((v{args[1]} == v{args[2]}) ? 0 : 1);  // double'),
-    0x30: ('cmpg-double', lambda args, _: f'v{args[0]} = (v{args[1]} > v{args[2]}) ? 1 : ((v{args[1]} == v{args[2]}) ? 0 : -1);  // double'),
-    0x31: ('cmp-long', lambda args, _: f'v{args[0]} = (v{args[1]} == v{args[2]}) ? 0 : ((v{args[1]} < v{args[2]}) ? -1 : 1);  // long'),
-    0x32: ('if-eq', lambda args, _: f'if (v{args[0]} == v{args[1]}) goto label_{args[2]};'),
-    0x33: ('if-ne', lambda args, _: f'if (v{args[0]} != v{args[1]}) goto label_{args[2]};'),
-    0x34: ('if-lt', lambda args, _: f'if (v{args[0]} < v{args[1]}) goto label_{args[2]};'),
-    0x35: ('if-ge', lambda args, _: f'if (v{args[0]} >= v{args[1]}) goto label_{args[2]};'),
-    0x36: ('if-gt', lambda args, _: f'if (v{args[0]} > v{args[1]}) goto label_{args[2]};'),
-    0x37: ('if-le', lambda args, _: f'if (v{args[0]} <= v{args[1]}) goto label_{args[2]};'),
-    0x38: ('if-eqz', lambda args, _: f'if (v{args[0]} == 0) goto label_{args[1]};'),
-    0x39: ('if-nez', lambda args, _: f'if (v{args[0]} != 0) goto label_{args[1]};'),
-    0x3a: ('if-ltz', lambda args, _: f'if (v{args[0]} < 0) goto label_{args[1]};'),
-    0x3b: ('if-gez', lambda args, _: f'if (v{args[0]} >= 0) goto label_{args[1]};'),
-    0x3c: ('if-gtz', lambda args, _: f'if (v{args[0]} > 0) goto label_{args[1]};'),
-    0x3d: ('if-lez', lambda args, _: f'if (v{args[0]} <= 0) goto label_{args[1]};'),
-    0x28: ('goto', lambda args, _: f'goto label_{args[0]};'),
-    0x29: ('goto/16', lambda args, _: f'goto label_{args[0]};  // 16-bit offset'),
-    0x2a: ('goto/32', lambda args, _: f'goto label_{args[0]};  // 32-bit offset'),
-    0x44: ('aget', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];'),
-    0x45: ('aget-wide', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // wide'),
-    0x46: ('aget-object', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // object'),
-    0x47: ('aget-boolean', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // boolean'),
-    0x48: ('aget-byte', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // byte'),
-    0x49: ('aget-char', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // char'),
-    0x4a: ('aget-short', lambda args, _: f'v{args[0]} = v{args[1]}[v{args[2]}];  // short'),
-    0x4b: ('aput', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};'),
-    0x4c: ('aput-wide', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // wide'),
-    0x4d: ('aput-object', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // object'),
-    0x4e: ('aput-boolean', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // boolean'),
-    0x4f: ('aput-byte', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // byte'),
-    0x50: ('aput-char', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // char'),
-    0x51: ('aput-short', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // short'),
-    0x22: ('new-instance', lambda args, types: f'v{args[0]} = new {types[args[1]]};'),
-    0x23: ('new-array', lambda args, types: f'v{args[0]} = new {types[args[2]]}[v{args[1]}];'),
-    0x20: ('instance-of', lambda args, types: f'v{args[0]} = (v{args[1]} instanceof {types[args[2]]});'),
-    0x21: ('check-cast', function),
-    0x1d: ('monitor-enter', lambda args, _: f'synchronized(v{args[0]}) {{'),
-    0x1e: ('monitor-exit', lambda args, _: f'}}  // end synchronized'),
-    0x27: ('throw', lambda args, _: f'throw v{args[0]};'),
-    0x26: ('fill-array-data', lambda args, _: f'// fill array with data'),
-    0x25: ('filled-new-array', lambda args, types: f'new {types[args[0]]}{{...}};'),
-    0x24: ('filled-new-array/range', lambda args, types: f'new {types[args[0]]}{{...}};  // range'),
+    0x00: ('nop', '', _CTX_NONE),
+    0x0e: ('return-void', 'return;', _CTX_NONE),
+    0x0f: ('return', 'return v%d;', _CTX_NONE),
+    0x10: ('return-wide', 'return v%d;  // wide', _CTX_NONE),
+    0x11: ('return-object', 'return v%d;  // object', _CTX_NONE),
+    0x01: ('move', 'v%d = v%d;', _CTX_NONE),
+    0x02: ('move/from16', 'v%d = v%d;', _CTX_NONE),
+    0x03: ('move/16', 'v%d = v%d;', _CTX_NONE),
+    0x04: ('move-wide', 'v%d = v%d;  // wide', _CTX_NONE),
+    0x05: ('move-wide/from16', 'v%d = v%d;  // wide', _CTX_NONE),
+    0x06: ('move-wide/16', 'v%d = v%d;  // wide', _CTX_NONE),
+    0x07: ('move-object', 'v%d = v%d;  // object', _CTX_NONE),
+    0x08: ('move-object/from16', 'v%d = v%d;  // object', _CTX_NONE),
+    0x09: ('move-object/16', 'v%d = v%d;  // object', _CTX_NONE),
+    0x0a: ('move-result', 'v%d = result;', _CTX_NONE),
+    0x0b: ('move-result-wide', 'v%d = result;  // wide', _CTX_NONE),
+    0x0c: ('move-result-object', 'v%d = result;  // object', _CTX_NONE),
+    0x0d: ('move-exception', 'v%d = exception;', _CTX_NONE),
+    0x12: ('const/4', lambda args, _: f'v{args[0]} = {args[1] & 0xF};', _CTX_NONE),
+    0x13: ('const/16', 'v%d = <literal>;  // literal not decoded', _CTX_NONE),
+    0x14: ('const', 'v%d = <literal>;  // literal not decoded', _CTX_NONE),
+    0x15: ('const/high16', 'v%d = <literal> << 16;  // literal not decoded', _CTX_NONE),
+    0x16: ('const-wide/16', 'v%d = <literal>;  // wide, literal not decoded', _CTX_NONE),
+    0x17: ('const-wide/32', 'v%d = <literal>;  // wide, literal not decoded', _CTX_NONE),
+    0x18: ('const-wide', 'v%d = <literal>;  // wide, literal not decoded', _CTX_NONE),
+    0x19: ('const-wide/high16', 'v%d = <literal> << 48;  // wide, literal not decoded', _CTX_NONE),
+    0x1a: ('const-string', lambda args, strings: f'v{args[0]} = "{strings[args[1]]}";', _CTX_STRINGS),
+    0x1b: ('const-string/jumbo', lambda args, strings: f'v{args[0]} = "{strings[args[1]]}";', _CTX_STRINGS),
+    0x1c: ('const-class', lambda args, types: f'v{args[0]} = {types[args[1]]}.class;', _CTX_TYPES),
+    0x52: ('iget', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};', _CTX_FIELD_NAMES),
+    0x53: ('iget-wide', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // wide', _CTX_FIELD_NAMES),
+    0x54: ('iget-object', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // object', _CTX_FIELD_NAMES),
+    0x55: ('iget-boolean', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // boolean', _CTX_FIELD_NAMES),
+    0x56: ('iget-byte', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // byte', _CTX_FIELD_NAMES),
+    0x57: ('iget-char', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // char', _CTX_FIELD_NAMES),
+    0x58: ('iget-short', lambda args, field_names: f'v{args[0]} = {field_names[args[2]]};  // short', _CTX_FIELD_NAMES),
+    0x59: ('iput', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};', _CTX_FIELD_NAMES),
+    0x5a: ('iput-wide', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // wide', _CTX_FIELD_NAMES),
+    0x5b: ('iput-object', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // object', _CTX_FIELD_NAMES),
+    0x5c: ('iput-boolean', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // boolean', _CTX_FIELD_NAMES),
+    0x5d: ('iput-byte', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // byte', _CTX_FIELD_NAMES),
+    0x5e: ('iput-char', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // char', _CTX_FIELD_NAMES),
+    0x5f: ('iput-short', lambda args, field_names: f'{field_names[args[2]]} = v{args[0]};  // short', _CTX_FIELD_NAMES),
+    0x60: ('sget', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static', _CTX_FIELD_NAMES),
+    0x61: ('sget-wide', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static wide', _CTX_FIELD_NAMES),
+    0x62: ('sget-object', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static object', _CTX_FIELD_NAMES),
+    0x63: ('sget-boolean', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static boolean', _CTX_FIELD_NAMES),
+    0x64: ('sget-byte', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static byte', _CTX_FIELD_NAMES),
+    0x65: ('sget-char', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static char', _CTX_FIELD_NAMES),
+    0x66: ('sget-short', lambda args, field_names: f'v{args[0]} = {field_names[args[1]]};  // static short', _CTX_FIELD_NAMES),
+    0x67: ('sput', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static', _CTX_FIELD_NAMES),
+    0x68: ('sput-wide', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static wide', _CTX_FIELD_NAMES),
+    0x69: ('sput-object', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static object', _CTX_FIELD_NAMES),
+    0x6a: ('sput-boolean', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static boolean', _CTX_FIELD_NAMES),
+    0x6b: ('sput-byte', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static byte', _CTX_FIELD_NAMES),
+    0x6c: ('sput-char', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static char', _CTX_FIELD_NAMES),
+    0x6d: ('sput-short', lambda args, field_names: f'{field_names[args[1]]} = v{args[0]};  // static short', _CTX_FIELD_NAMES),
+    0x6e: ('invoke-virtual', lambda args, method_names: f'v{args[1]}.{method_names[args[0]]}(...);', _CTX_METHOD_NAMES),
+    0x6f: ('invoke-super', lambda args, method_names: f'super.{method_names[args[0]]}(...);', _CTX_METHOD_NAMES),
+    0x70: ('invoke-direct', lambda args, method_names: f'{method_names[args[0]]}(...);', _CTX_METHOD_NAMES),
+    0x71: ('invoke-static', lambda args, method_sigs: f'{method_sigs[args[0]]}(...);', _CTX_METHOD_SIGS),
+    0x72: ('invoke-interface', lambda args, method_names: f'v{args[1]}.{method_names[args[0]]}(...);  // interface', _CTX_METHOD_NAMES),
+    0x74: ('invoke-virtual/range', lambda args, method_names: f'v{args[1]}.{method_names[args[0]]}(...);  // range', _CTX_METHOD_NAMES),
+    0x75: ('invoke-super/range', lambda args, method_names: f'super.{method_names[args[0]]}(...);  // range', _CTX_METHOD_NAMES),
+    0x76: ('invoke-direct/range', lambda args, method_names: f'{method_names[args[0]]}(...);  // range', _CTX_METHOD_NAMES),
+    0x77: ('invoke-static/range', lambda args, method_sigs: f'{method_sigs[args[0]]}(...);  // range', _CTX_METHOD_SIGS),
+    0x78: ('invoke-interface/range', lambda args, method_names: f'v{args[1]}.{method_names[args[0]]}(...);  // interface, range', _CTX_METHOD_NAMES),
+    0x90: ('add-int', 'v%d = v%d + v%d;', _CTX_NONE),
+    0x91: ('sub-int', 'v%d = v%d - v%d;', _CTX_NONE),
+    0x92: ('mul-int', 'v%d = v%d * v%d;', _CTX_NONE),
+    0x93: ('div-int', 'v%d = v%d / v%d;', _CTX_NONE),
+    0x94: ('rem-int', 'v%d = v%d %% v%d;', _CTX_NONE),
+    0x95: ('and-int', 'v%d = v%d & v%d;', _CTX_NONE),
+    0x96: ('or-int', 'v%d = v%d | v%d;', _CTX_NONE),
+    0x97: ('xor-int', 'v%d = v%d ^ v%d;', _CTX_NONE),
+    0x98: ('shl-int', 'v%d = v%d << v%d;', _CTX_NONE),
+    0x99: ('shr-int', 'v%d = v%d >> v%d;', _CTX_NONE),
+    0x9a: ('ushr-int', 'v%d = v%d >>> v%d;', _CTX_NONE),
+    0xb0: ('add-int/2addr', 'v%d += v%d;', _CTX_NONE),
+    0xb1: ('sub-int/2addr', 'v%d -= v%d;', _CTX_NONE),
+    0xb2: ('mul-int/2addr', 'v%d *= v%d;', _CTX_NONE),
+    0xb3: ('div-int/2addr', 'v%d /= v%d;', _CTX_NONE),
+    0xb4: ('rem-int/2addr', 'v%d %%= v%d;', _CTX_NONE),
+    0xb5: ('and-int/2addr', 'v%d &= v%d;', _CTX_NONE),
+    0xb6: ('or-int/2addr', 'v%d |= v%d;', _CTX_NONE),
+    0xb7: ('xor-int/2addr', 'v%d ^= v%d;', _CTX_NONE),
+    0xb8: ('shl-int/2addr', 'v%d <<= v%d;', _CTX_NONE),
+    0xb9: ('shr-int/2addr', 'v%d >>= v%d;', _CTX_NONE),
+    0xba: ('ushr-int/2addr', 'v%d >>>= v%d;', _CTX_NONE),
+    0xd0: ('add-int/lit16', 'v%d = v%d + <literal>;  // literal not decoded', _CTX_NONE),
+    0xd1: ('sub-int/lit16', 'v%d = v%d - <literal>;  // literal not decoded', _CTX_NONE),
+    0xd2: ('mul-int/lit16', 'v%d = v%d * <literal>;  // literal not decoded', _CTX_NONE),
+    0xd3: ('div-int/lit16', 'v%d = v%d / <literal>;  // literal not decoded', _CTX_NONE),
+    0xd4: ('rem-int/lit16', 'v%d = v%d %% <literal>;  // literal not decoded', _CTX_NONE),
+    0xd5: ('and-int/lit16', 'v%d = v%d & <literal>;  // literal not decoded', _CTX_NONE),
+    0xd6: ('or-int/lit16', 'v%d = v%d | <literal>;  // literal not decoded', _CTX_NONE),
+    0xd7: ('xor-int/lit16', 'v%d = v%d ^ <literal>;  // literal not decoded', _CTX_NONE),
+    0xd8: ('add-int/lit8', 'v%d = v%d + <literal>;  // literal not decoded', _CTX_NONE),
+    0xd9: ('sub-int/lit8', 'v%d = v%d - <literal>;  // literal not decoded', _CTX_NONE),
+    0xda: ('mul-int/lit8', 'v%d = v%d * <literal>;  // literal not decoded', _CTX_NONE),
+    0xdb: ('div-int/lit8', 'v%d = v%d / <literal>;  // literal not decoded', _CTX_NONE),
+    0xdc: ('rem-int/lit8', 'v%d = v%d %% <literal>;  // literal not decoded', _CTX_NONE),
+    0xdd: ('and-int/lit8', 'v%d = v%d & <literal>;  // literal not decoded', _CTX_NONE),
+    0xde: ('or-int/lit8', 'v%d = v%d | <literal>;  // literal not decoded', _CTX_NONE),
+    0xdf: ('xor-int/lit8', 'v%d = v%d ^ <literal>;  // literal not decoded', _CTX_NONE),
+    0xe0: ('shl-int/lit8', 'v%d = v%d << <literal>;  // literal not decoded', _CTX_NONE),
+    0xe1: ('shr-int/lit8', 'v%d = v%d >> <literal>;  // literal not decoded', _CTX_NONE),
+    0xe2: ('ushr-int/lit8', 'v%d = v%d >>> <literal>;  // literal not decoded', _CTX_NONE),
+    0x2d: ('cmpl-float', lambda args, _: f'v{args[0]} = (v{args[1]} < v{args[2]}) ? -1 : ((v{args[1]} == v{args[2]}) ? 0 : 1);', _CTX_NONE),
+    0x2e: ('cmpg-float', lambda args, _: f'v{args[0]} = (v{args[1]} > v{args[2]}) ? 1 : ((v{args[1]} == v{args[2]}) ? 0 : -1);', _CTX_NONE),
+    0x2f: ('cmpl-double', lambda args, _: f'v{args[0]} = (v{args[1]} < v{args[2]}) ? -1 : ((v{args[1]} == v{args[2]}) ? 0 : 1);  // double', _CTX_NONE),
+    0x30: ('cmpg-double', lambda args, _: f'v{args[0]} = (v{args[1]} > v{args[2]}) ? 1 : ((v{args[1]} == v{args[2]}) ? 0 : -1);  // double', _CTX_NONE),
+    0x31: ('cmp-long', lambda args, _: f'v{args[0]} = (v{args[1]} == v{args[2]}) ? 0 : ((v{args[1]} < v{args[2]}) ? -1 : 1);  // long', _CTX_NONE),
+    0x32: ('if-eq', 'if (v%d == v%d) goto label_%d;', _CTX_NONE),
+    0x33: ('if-ne', 'if (v%d != v%d) goto label_%d;', _CTX_NONE),
+    0x34: ('if-lt', 'if (v%d < v%d) goto label_%d;', _CTX_NONE),
+    0x35: ('if-ge', 'if (v%d >= v%d) goto label_%d;', _CTX_NONE),
+    0x36: ('if-gt', 'if (v%d > v%d) goto label_%d;', _CTX_NONE),
+    0x37: ('if-le', 'if (v%d <= v%d) goto label_%d;', _CTX_NONE),
+    0x38: ('if-eqz', 'if (v%d == 0) goto label_%d;', _CTX_NONE),
+    0x39: ('if-nez', 'if (v%d != 0) goto label_%d;', _CTX_NONE),
+    0x3a: ('if-ltz', 'if (v%d < 0) goto label_%d;', _CTX_NONE),
+    0x3b: ('if-gez', 'if (v%d >= 0) goto label_%d;', _CTX_NONE),
+    0x3c: ('if-gtz', 'if (v%d > 0) goto label_%d;', _CTX_NONE),
+    0x3d: ('if-lez', 'if (v%d <= 0) goto label_%d;', _CTX_NONE),
+    0x28: ('goto', 'goto label_%d;', _CTX_NONE),
+    0x29: ('goto/16', 'goto label_%d;  // 16-bit offset', _CTX_NONE),
+    0x2a: ('goto/32', 'goto label_%d;  // 32-bit offset', _CTX_NONE),
+    0x44: ('aget', 'v%d = v%d[v%d];', _CTX_NONE),
+    0x45: ('aget-wide', 'v%d = v%d[v%d];  // wide', _CTX_NONE),
+    0x46: ('aget-object', 'v%d = v%d[v%d];  // object', _CTX_NONE),
+    0x47: ('aget-boolean', 'v%d = v%d[v%d];  // boolean', _CTX_NONE),
+    0x48: ('aget-byte', 'v%d = v%d[v%d];  // byte', _CTX_NONE),
+    0x49: ('aget-char', 'v%d = v%d[v%d];  // char', _CTX_NONE),
+    0x4a: ('aget-short', 'v%d = v%d[v%d];  // short', _CTX_NONE),
+    0x4b: ('aput', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};', _CTX_NONE),
+    0x4c: ('aput-wide', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // wide', _CTX_NONE),
+    0x4d: ('aput-object', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // object', _CTX_NONE),
+    0x4e: ('aput-boolean', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // boolean', _CTX_NONE),
+    0x4f: ('aput-byte', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // byte', _CTX_NONE),
+    0x50: ('aput-char', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // char', _CTX_NONE),
+    0x51: ('aput-short', lambda args, _: f'v{args[1]}[v{args[2]}] = v{args[0]};  // short', _CTX_NONE),
+    0x22: ('new-instance', lambda args, types: f'v{args[0]} = new {types[args[1]]};', _CTX_TYPES),
+    0x23: ('new-array', lambda args, types: f'v{args[0]} = new {types[args[2]]}[v{args[1]}];', _CTX_TYPES),
+    0x20: ('instance-of', lambda args, types: f'v{args[0]} = (v{args[1]} instanceof {types[args[2]]});', _CTX_TYPES),
+    0x21: ('check-cast', function, _CTX_TYPES),
+    0x1d: ('monitor-enter', 'synchronized(v%d) {', _CTX_NONE),
+    0x1e: ('monitor-exit', '}  // end synchronized', _CTX_NONE),
+    0x27: ('throw', 'throw v%d;', _CTX_NONE),
+    0x26: ('fill-array-data', '// fill array with data', _CTX_NONE),
+    0x25: ('filled-new-array', lambda args, types: f'new {types[args[0]]}{{...}};', _CTX_TYPES),
+    0x24: ('filled-new-array/range', lambda args, types: f'new {types[args[0]]}{{...}};  // range', _CTX_TYPES),
 }
 
-def decompile_method_code(data: bytes, offset: int, strings: List[str], fields: List[Dict[str, str]], methods: List[Dict[str, str]]) -> List[str]:
+# OPCODE_MAP'teki bir handler ya operandların sırayla yerleştirildiği bir % şablonudur ya da tablo
+# araması/hesap gerektiren bir fonksiyondur. Şablonlar C seviyesindeki % biçimlendirmesiyle, fonksiyon
+# çağrısı olmadan doldurulur.
+# Opcode'lar 0-255 aralığında yoğun olduğundan, sıcak döngüde sözlük yerine doğrudan indekslenen tablolar kullanılır.
+_OPCODE_TABLE = [OPCODE_MAP[op][1] if op in OPCODE_MAP and callable(OPCODE_MAP[op][1]) else None for op in range(256)]
+_OPCODE_FORMAT = [OPCODE_MAP[op][1] if op in OPCODE_MAP and isinstance(OPCODE_MAP[op][1], str) else None
+                  for op in range(256)]
+_OPCODE_ARITY = [fmt.count('%d') if fmt is not None else 0 for fmt in _OPCODE_FORMAT]
+_CTX_KIND = [OPCODE_MAP[op][2] if op in OPCODE_MAP else _CTX_NONE for op in range(256)]
+
+# Çıktısı operandlardan bağımsız olan opcode'lar (operandsız şablonlar) ve bilinmeyen opcode'lar için
+# satır önceden hazırlanır; sıcak döngüde bunlar için biçimlendirme yapılmaz.
+_CONST_OUT = [None] * 256
+for _op in range(256):
+    if _op not in OPCODE_MAP:
+        _CONST_OUT[_op] = f'// Unknown opcode: 0x{_op:02x}'
+    elif _OPCODE_FORMAT[_op] is not None and _OPCODE_ARITY[_op] == 0:
+        _CONST_OUT[_op] = _OPCODE_FORMAT[_op] % ()
+
+def build_decompile_context(strings: List[str], types: List[str], fields: Dict[str, List[str]], methods: Dict[str, list]) -> Tuple[List[str], ...]:
+    """Handler'ların kullandığı isim tablolarını bir kez çözüp _CTX_* sırasına göre tek bir demette toplar."""
+    method_sigs = [f'{cls}.{name}' for cls, name in zip(methods['class'], methods['name'])]
+    return (None, strings, types, fields['name'], methods['name'], method_sigs)
+
+def decompile_method_code(data: bytes, offset: int, context: Tuple[List[str], ...]) -> List[str]:
     """Yöntem kodunu Dalvik bytecode'dan Java'ya çevirir."""
     if offset == 0:
         return []
-    registers_size, _, _, _, _, insns_size = struct.unpack('<HHHHII', data[offset:offset + 16])
-    insns_offset = offset + 16
+    registers_size, _, _, _, _, insns_size = _CODE_HDR.unpack_from(data, offset)
+    insns_offset = offset + _CODE_HDR.size
+    # Komut akışı tek dilimde okunur; her 2 baytlık kod biriminin ilk baytı opcode, ikincisi operanddır.
+    insns = data[insns_offset:insns_offset + insns_size * 2]
+    if len(insns) != insns_size * 2:
+        raise DexParseError("Yöntem kodu dosya sınırını aşıyor")
     code = []
-    pc = 0
-    while pc < insns_size * 2:
-        opcode = data[insns_offset + pc]
-        if opcode not in OPCODE_MAP:
-            code.append(f'// Unknown opcode: 0x{opcode:02x}')
-            pc += 2
-            continue
-        name, handler = OPCODE_MAP[opcode]
-        args = struct.unpack('<BB', data[insns_offset + pc:insns_offset + pc + 2])
-        pc += 2
-        code.append(handler(args, strings if 'const-string' in name else methods))
+    for opcode, operand in zip(insns[0::2], insns[1::2]):
+        line = _CONST_OUT[opcode]
+        if line is None:
+            fmt = _OPCODE_FORMAT[opcode]
+            if fmt is None:
+                line = _OPCODE_TABLE[opcode]((opcode, operand), context[_CTX_KIND[opcode]])
+            elif _OPCODE_ARITY[opcode] == 1:
+                line = fmt % opcode
+            else:
+                line = fmt % (opcode, operand)
+        code.append(line)
     return code
 
 ### APK İşleme Fonksiyonları ###
@@ -320,16 +376,17 @@ def run_apktool(apk_file: str, output_dir: str) -> str:
     """APK dosyasını apktool ile ayrıştırır ve DEX dosyalarının bulunduğu dizini döndürür."""
     apktool_output = os.path.join(output_dir, "apktool_out")
     try:
-        result = subprocess.run(
+        # apktool'un uzun stdout çıktısı kullanılmadığı için atılır; yalnızca hata mesajı için stderr tutulur.
+        subprocess.run(
             ["apktool", "d", apk_file, "-f", "-o", apktool_output],
             check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
-        logger.info(f"APK ayrıştırıldı: {apktool_output}")
+        logger.info("APK ayrıştırıldı: %s", apktool_output)
         return apktool_output
     except subprocess.CalledProcessError as e:
-        logger.error(f"apktool hatası: {e.stderr}")
+        logger.error("apktool hatası: %s", e.stderr.decode(errors="replace"))
         sys.exit(1)
     except FileNotFoundError:
         logger.error("apktool bulunamadı. Lütfen apktool'u kurun ve PATH'e ekleyin.")
@@ -341,9 +398,50 @@ def find_dex_files(apktool_dir: str) -> List[str]:
     if not dex_files:
         logger.error("APK'da DEX dosyası bulunamadı.")
         sys.exit(1)
-    logger.info(f"Bulunan DEX dosyaları: {dex_files}")
+    logger.info("Bulunan DEX dosyaları: %s", dex_files)
     return dex_files
 
+def process_dex_file(dex_file: str, output_dir: str) -> None:
+    """Tek bir DEX dosyasını decompile edip çıktısını output_dir içine yazar."""
+    logger.info("İşleniyor: %s", dex_file)
+    try:
+        with open(dex_file, "rb") as f:
+            # Boş dosyalar mmap ile açılamaz; bunlar da geçersiz DEX sayılır.
+            if os.fstat(f.fileno()).st_size == 0:
+                raise DexParseError("Geçersiz DEX dosya formatı")
+            # Dosyayı tek seferde okumak yerine mmap ile sayfa sayfa erişiyoruz.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header = parse_header(data)
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    data.madvise(mmap.MADV_SEQUENTIAL)
+                strings = parse_strings(data, header)
+                types = parse_types(data, header, strings)
+                fields = parse_fields(data, header, strings, types)
+                methods = parse_methods(data, header, strings, types)
+                classes = parse_classes(data, header, strings, types)
+
+                # Decompilation
+                context = build_decompile_context(strings, types, fields, methods)
+                decompiled = {}
+                for cls_name, data_offset in zip(classes['name'], classes['data_offset']):
+                    code = decompile_method_code(data, data_offset, context)
+                    decompiled[cls_name] = code
+
+        # Çıktı dosyası (her DEX için ayrı dosya)
+        dex_name = os.path.basename(dex_file)
+        output_file = os.path.join(output_dir, f"decompiled_{dex_name}.txt")
+        # Satır satır yazmak yerine her sınıfın çıktısını tek parça halinde yazıyoruz.
+        with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as out_file:
+            for cls_name, code in decompiled.items():
+                body = "  " + "\n  ".join(code) + "\n" if code else ""
+                out_file.write(f"Class: {cls_name}\n{{\n{body}}}\n\n")
+        logger.info("Decompile tamamlandı: %s", output_file)
+
+    except DexParseError as e:
+        logger.error("DEX ayrıştırma hatası (%s): %s", dex_file, e)
+    except Exception as e:
+        logger.error("Beklenmedik hata (%s): %s", dex_file, e)
+
 ### Ana Fonksiyon ###
 def main():
     parser = argparse.ArgumentParser(description="APK Decompiler with apktool")
@@ -352,7 +450,7 @@ def main():
     args = parser.parse_args()
 
     if not os.path.exists(args.input):
-        logger.error(f"Dosya bulunamadı: {args.input}")
+        logger.error("Dosya bulunamadı: %s", args.input)
         sys.exit(1)
     os.makedirs(args.output, exist_ok=True)
 
@@ -360,44 +458,14 @@ def main():
     apktool_dir = run_apktool(args.input, args.output)
     dex_files = find_dex_files(apktool_dir)
 
-    # Her DEX dosyası için decompile işlemi
-    for dex_file in dex_files:
-        logger.info(f"İşleniyor: {dex_file}")
-        with open(dex_file, "rb") as f:
-            data = f.read()
-
-        try:
-            header = parse_header(data)
-            strings = parse_strings(data, header)
-            types = parse_types(data, header, strings)
-            fields = parse_fields(data, header, strings, types)
-            methods = parse_methods(data, header, strings, types)
-            classes = parse_classes(data, header, strings, types)
-
-            # Decompilation
-            decompiled = {}
-            for cls in classes:
-                code = decompile_method_code(data, cls['data_offset'], strings, fields, methods)
-                decompiled[cls['name']] = code
-
-            # Çıktı dosyası (her DEX için ayrı dosya)
-            dex_name = os.path.basename(dex_file)
-            output_file = os.path.join(args.output, f"decompiled_{dex_name}.txt")
-            with open(output_file, "w") as out_file:
-                for cls_name, code in decompiled.items():
-                    out_file.write(f"Class: {cls_name}\n")
-                    out_file.write("{\n")
-                    for line in code:
-                        out_file.write(f"  {line}\n")
-                    out_file.write("}\n\n")
-            logger.info(f"Decompile tamamlandı: {output_file}")
-
-        except DexParseError as e:
-            logger.error(f"DEX ayrıştırma hatası ({dex_file}): {e}")
-            continue
-        except Exception as e:
-            logger.error(f"Beklenmedik hata ({dex_file}): {e}")
-            continue
+    # Her DEX dosyası bağımsız ve CPU yoğun olduğundan, GIL'e takılmamak için ayrı süreçlerde işlenir.
+    workers = min(len(dex_files), os.cpu_count() or 1)
+    if workers == 1:
+        for dex_file in dex_files:
+            process_dex_file(dex_file, args.output)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(process_dex_file, dex_files, [args.output] * len(dex_files)))
 
 if __name__ == "__main__":
     main()
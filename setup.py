@@ -0,0 +1,16 @@
+# İsteğe bağlı Cython hızlandırıcısını (_dex_fast) derler.
+# Bu dosya yalnızca yerinde derleme içindir, paket kurulumu (pip install) için değildir:
+#     python setup.py build_ext --inplace
+# Derlenmiş modül bulunmazsa apk_decompiler.py saf Python sürümleriyle çalışmaya devam eder.
+import sys
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    sys.exit("Cython bulunamadı. Hızlandırıcıyı derlemek için önce 'pip install cython' çalıştırın.")
+
+setup(
+    name="dex-apk-decompiler",
+    ext_modules=cythonize("_dex_fast.pyx"),
+)